@@ -1,35 +1,53 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Query
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from src.models.crop_price_model import EnhancedCropPriceModel
 from src.utils.data_loader import data_manager, load_data  # Import both
-import pandas as pd
 import logging
+import threading
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Initialize model (trained in the background after startup, not at import)
+model = EnhancedCropPriceModel()
+model_ready = threading.Event()
+price_data = None
+rainfall_data = None
+
+def load_model_and_data():
+    """Train the crop model and load the price/rainfall tables."""
+    global price_data, rainfall_data
+    import pandas as pd
+
+    # Load data with error handling
+    try:
+        model.train_crop_model("data/raw/Crop_recommendation.csv")
+        price_data = data_manager.load_data("data/processed/processed_data.csv")
+        rainfall_data = data_manager.load_data("data/raw/district_wise_rainfall_normal.csv")
+        logger.info("Data loaded successfully")
+    except Exception as e:
+        logger.error(f"Failed to load data: {e}")
+        price_data = pd.DataFrame()
+        rainfall_data = pd.DataFrame()
+    finally:
+        model_ready.set()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # train off the event loop so /health answers while the model is still loading
+    threading.Thread(target=load_model_and_data, name="model-loader", daemon=True).start()
+    yield
+
 app = FastAPI(
     title="Enhanced Crop Recommendation & Price Forecasting API",
     description="AI-powered agricultural recommendations with market analysis",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
-# Initialize model
-model = EnhancedCropPriceModel()
-
-# Load data with error handling
-try:
-    model.train_crop_model("data/raw/Crop_recommendation.csv")
-    price_data = data_manager.load_data("data/processed/processed_data.csv")
-    rainfall_data = data_manager.load_data("data/raw/district_wise_rainfall_normal.csv")
-    logger.info("Data loaded successfully")
-except Exception as e:
-    logger.error(f"Failed to load data: {e}")
-    price_data = pd.DataFrame()
-    rainfall_data = pd.DataFrame()
-
 class RecommendationRequest(BaseModel):
     state: str = Field(..., min_length=2, max_length=50, description="State name")
     district: str = Field(..., min_length=2, max_length=50, description="District name")
@@ -47,9 +65,10 @@ async def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
-        "model_loaded": model.model is not None,
-        "data_available": not price_data.empty and not rainfall_data.empty,
-        "available_crops": list(model.label_encoder.classes_) if hasattr(model, 'label_encoder') and model.label_encoder else []
+        "model_loaded": model_ready.is_set() and model.model is not None,
+        "data_available": price_data is not None and rainfall_data is not None
+                          and not price_data.empty and not rainfall_data.empty,
+        "available_crops": list(model.label_encoder.classes_) if model_ready.is_set() and model.label_encoder else []
     }
 
 @app.get("/recommend", response_model=RecommendationResponse)
@@ -71,6 +90,8 @@ async def recommend_crop(
         # Validate inputs
         if not state or not district:
             raise HTTPException(status_code=400, detail="State and district are required")
+        if not model_ready.is_set() or model.model is None:
+            raise HTTPException(status_code=503, detail="Model not ready")
         
         recommendation = model.recommend_crop(state, district, price_data, rainfall_data)
         
@@ -88,7 +109,7 @@ async def recommend_crop(
 @app.get("/crops")
 async def get_available_crops():
     """Get list of crops the model can recommend."""
-    if not hasattr(model, 'label_encoder') or model.label_encoder is None:
+    if not model_ready.is_set() or model.label_encoder is None:
         raise HTTPException(status_code=503, detail="Model not ready")
     
     return {
@@ -1,12 +1,16 @@
-import pandas as pd
-import numpy as np
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.preprocessing import LabelEncoder
-from typing import Dict, Any, Optional, Tuple, List  # Added List import
+from __future__ import annotations
+
+from typing import Dict, Any, Optional, Tuple, List, TYPE_CHECKING  # Added List import
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
+# pandas, numpy and sklearn are imported where they are used so that importing
+# this module (e.g. from the API) stays cheap until the model is trained
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
 # Global data_manager reference (we'll create this in utils)
 try:
     from src.utils.data_loader import data_manager
@@ -14,6 +18,7 @@ except ImportError:
     # Fallback for standalone usage
     class DummyDataManager:
         def load_data(self, path):
+            import pandas as pd
             return pd.read_csv(path)
     data_manager = DummyDataManager()
 
@@ -21,15 +26,19 @@ class EnhancedCropPriceModel:
     def __init__(self):
         self.model = None
         self.crop_data = None
-        self.label_encoder = LabelEncoder()
+        self.label_encoder = None
         self.feature_means = {}
         self.feature_ranges = {}
         
     def train_crop_model(self, crop_data_path: str):
         """Train RandomForestClassifier for crop recommendation with feature analysis."""
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.preprocessing import LabelEncoder
+
         self.crop_data = data_manager.load_data(crop_data_path)
         
         # Encode labels
+        self.label_encoder = LabelEncoder()
         y_encoded = self.label_encoder.fit_transform(self.crop_data['label'])
         
         # Store feature statistics for better predictions
@@ -47,6 +56,8 @@ class EnhancedCropPriceModel:
     
     def _generate_environmental_conditions(self, rainfall: float) -> np.ndarray:
         """Generate realistic environmental conditions based on rainfall patterns."""
+        import numpy as np
+
         conditions = []
         
         # Base conditions from averages
@@ -87,6 +98,8 @@ class EnhancedCropPriceModel:
     def _forecast_prices(self, price_data: pd.DataFrame, crop: str, 
                         lookback_days: int = 90) -> Optional[Dict[str, Any]]:
         """Enhanced price forecasting with crop-specific filtering."""
+        import pandas as pd
+
         if price_data.empty:
             return None
             
@@ -147,6 +160,8 @@ class EnhancedCropPriceModel:
     
     def _calculate_price_confidence(self, data: pd.DataFrame) -> float:
         """Calculate confidence score based on price stability."""
+        import pandas as pd
+
         if len(data) < 3:
             return 0.5
         
@@ -165,6 +180,8 @@ class EnhancedCropPriceModel:
     def recommend_crop(self, state: str, district: str, 
                       price_data: pd.DataFrame, rainfall_data: pd.DataFrame) -> Dict[str, Any]:
         """Enhanced crop recommendation with better environmental modeling."""
+        import numpy as np
+
         # Normalize inputs
         state = state.strip().upper()
         district = district.strip().upper()
@@ -218,6 +235,8 @@ class EnhancedCropPriceModel:
     
     def _get_alternative_recommendations(self, input_features: np.ndarray) -> List[str]:
         """Get top 3 crop recommendations."""
+        import numpy as np
+
         probabilities = self.model.predict_proba(input_features)[0]
         top_indices = np.argsort(probabilities)[-3:][::-1]
         main_crop_idx = np.argmax(probabilities)
@@ -232,6 +251,8 @@ class EnhancedCropPriceModel:
     def _get_alternative_locations(self, rainfall_data: pd.DataFrame, 
                                  state: str, district: str) -> List[Dict]:
         """Suggest alternative locations with similar rainfall."""
+        import pandas as pd
+
         # Get target rainfall (approximate)
         target_rainfall = rainfall_data[
             (rainfall_data['STATE_UT_NAME'] == state)
@@ -1,7 +1,11 @@
-import pandas as pd
+from __future__ import annotations
+
 import os
 from functools import lru_cache
-from typing import Dict
+from typing import Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class DataManager:
     def __init__(self):
@@ -10,6 +14,8 @@ class DataManager:
     @lru_cache(maxsize=1)
     def load_data(self, file_path: str) -> pd.DataFrame:
         """Load CSV data from the specified path with caching."""
+        import pandas as pd
+
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File {file_path} not found")
         df = pd.read_csv(file_path)
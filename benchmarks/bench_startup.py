@@ -0,0 +1,120 @@
+# benchmarks/bench_startup.py
+# Startup regression benchmark: `python -X importtime` cost of the entry points and
+# the time from launching the backend API until it answers its first request and
+# until its crop model is loaded (training runs in the background after startup).
+# Exits non-zero when a budget is exceeded or a heavy library is imported eagerly.
+import argparse
+import json
+import re
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+BACKEND = ROOT/"backend"
+
+# (name, argv, cwd, budget in seconds, modules that must not be imported)
+IMPORT_TARGETS = [
+    ("cli --help", ["cli.py", "--help"], ROOT, 0.3,
+     ["pandas", "numpy", "statsmodels", "sklearn"]),
+    ("models/train_price", ["-c", "import train_price"], ROOT/"models", 1.5,
+     ["statsmodels"]),
+    ("backend api import", ["-c", "import src.api.main"], BACKEND, 1.5,
+     ["sklearn", "pandas"]),
+]
+FIRST_REQUEST_BUDGET = 1.5  # seconds, process launch -> first 200 from /health
+MODEL_READY_BUDGET = 6.0    # seconds, process launch -> /health reports model_loaded
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def measure_imports(argv, cwd):
+    """Total import time (s) and the set of imported top-level packages."""
+    proc = subprocess.run([sys.executable, "-X", "importtime"] + argv, cwd=cwd,
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    total, modules = 0, set()
+    for match in IMPORT_LINE.finditer(proc.stderr):
+        _, cumulative, indent, name = match.groups()
+        modules.add(name.split('.')[0])
+        if not indent:
+            total += int(cumulative)
+    return total / 1e6, modules
+
+
+def measure_server(timeout=60.0):
+    """Seconds from launching uvicorn on the backend app to the first 200 from /health,
+    and to the first /health response with model_loaded true."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    url = f"http://127.0.0.1:{port}/health"
+
+    first = None
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.api.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - start < timeout:
+            if server.poll() is not None:
+                raise RuntimeError("uvicorn exited before serving a request")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as resp:
+                    if resp.status == 200:
+                        elapsed = time.perf_counter() - start
+                        first = first if first is not None else elapsed
+                        if json.load(resp).get("model_loaded"):
+                            return first, elapsed
+            except OSError:
+                pass
+            time.sleep(0.02)
+        state = "model never loaded" if first is not None else "no response"
+        raise RuntimeError(f"{state} from {url} within {timeout:.0f}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Startup and import-time regression benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (best is kept)")
+    parser.add_argument("--budget-scale", type=float, default=1.0,
+                        help="multiply all budgets, e.g. on slow CI machines")
+    parser.add_argument("--skip-server", action="store_true", help="skip the API server measurements")
+    args = parser.parse_args(argv)
+
+    failures = []
+    print(f"{'target':<24}{'best (s)':>10}{'budget (s)':>12}")
+    for name, target, cwd, budget, forbidden in IMPORT_TARGETS:
+        budget *= args.budget_scale
+        runs = [measure_imports(target, cwd) for _ in range(args.repeat)]
+        best = min(t for t, _ in runs)
+        print(f"{name:<24}{best:>10.3f}{budget:>12.2f}")
+        if best > budget:
+            failures.append(f"{name}: import took {best:.3f}s (budget {budget:.2f}s)")
+        eager = sorted(set(forbidden) & runs[0][1])
+        if eager:
+            failures.append(f"{name}: imports {', '.join(eager)} eagerly")
+
+    if not args.skip_server:
+        runs = [measure_server() for _ in range(args.repeat)]
+        for name, index, budget in [("api first request", 0, FIRST_REQUEST_BUDGET),
+                                    ("api model ready", 1, MODEL_READY_BUDGET)]:
+            budget *= args.budget_scale
+            best = min(run[index] for run in runs)
+            print(f"{name:<24}{best:>10.3f}{budget:>12.2f}")
+            if best > budget:
+                failures.append(f"{name}: {best:.3f}s (budget {budget:.2f}s)")
+
+    for failure in failures:
+        print("REGRESSION:", failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
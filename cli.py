@@ -0,0 +1,91 @@
+# cli.py
+# Single entry point for the pipeline scripts. Each subcommand imports its module
+# only when it runs, so `python cli.py --help` does not load pandas or statsmodels.
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+sys.path[:0] = [str(ROOT/"etl"), str(ROOT/"models")]
+
+CROP = "tomato"
+MARKET_ID = "MAH_Pune"
+HORIZON = 30
+
+
+def cmd_etl(args):
+    if args.synthetic:
+        import generate_synthetic_data
+        generate_synthetic_data.main()
+    import prepare_data
+    prepare_data.main(args.crop, args.market_id)
+
+
+def cmd_features(args):
+    import build_features
+    build_features.main()
+
+
+def cmd_train(args):
+    import train_price
+    train_price.main(args.crop, args.market_id, args.horizon)
+
+
+def cmd_forecast(args):
+    import naive_forecast
+    naive_forecast.main(args.crop, args.market_id, args.horizon)
+
+
+def cmd_glut(args):
+    import glut_signal
+    glut_signal.main(args.crop, args.market_id, args.horizon)
+
+
+def cmd_backtest(args):
+    import backtest
+    backtest.main(args.extra)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Crop glut prevention pipeline")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    series = argparse.ArgumentParser(add_help=False)
+    series.add_argument("--crop", default=CROP)
+    series.add_argument("--market-id", default=MARKET_ID)
+    horizon = argparse.ArgumentParser(add_help=False)
+    horizon.add_argument("--horizon", type=int, default=HORIZON)
+
+    p = sub.add_parser("etl", parents=[series], help="build per-market price features")
+    p.add_argument("--synthetic", action="store_true", help="generate synthetic raw data first")
+    p.set_defaults(func=cmd_etl)
+
+    p = sub.add_parser("features", help="build national supply-pressure features")
+    p.set_defaults(func=cmd_features)
+
+    p = sub.add_parser("train", parents=[series, horizon], help="fit SARIMAX and save its forecast")
+    p.set_defaults(func=cmd_train)
+
+    p = sub.add_parser("forecast", parents=[series, horizon], help="save the naive moving-average forecast")
+    p.set_defaults(func=cmd_forecast)
+
+    p = sub.add_parser("glut", parents=[series, horizon], help="score glut risk from the saved forecast")
+    p.set_defaults(func=cmd_glut)
+
+    # no -h here: --help is passed through to backtest's own parser
+    p = sub.add_parser("backtest", add_help=False, help="rolling-origin backtest (options are passed through)")
+    p.set_defaults(func=cmd_backtest)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if extra and args.command != "backtest":
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    args.extra = extra
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
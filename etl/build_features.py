@@ -0,0 +1,272 @@
+# etl/build_features.py
+# Supply-pressure features per (commodity, market, day) from the national mandi
+# price history, the crop calendar and the district rainfall normals.
+import re
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+RAW = Path("data/raw")
+PROC = Path("data/processed")
+
+# config
+VOL_WINDOW = "30D"       # rolling window for price volatility
+RAIN_WINDOW = "30D"      # trailing window compared against the monthly normal
+
+MARKET_KEYS = ['state', 'district', 'market']
+SERIES_KEYS = ['commodity'] + MARKET_KEYS
+MONTHS = ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN',
+          'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']
+
+# mandi commodity names that differ from the crop calendar naming; matched exactly
+# on the base name so processed goods (e.g. 'Mustard Oil') do not pick up a harvest
+CROP_SYNONYMS = {
+    'paddy': 'rice',
+    'groundnut': 'peanut',
+    'groundnut pods': 'peanut',
+    'ground nut seed': 'peanut',
+    'maize': 'corn',
+    'soyabean': 'soybean',
+    'bajra': 'millet',
+    'jowar': 'sorghum',
+    'mustard': 'rapeseed',
+    'sunflower': 'sunflowerseed',
+}
+
+# the mandi feed and the rainfall normals spell places differently; names are compared
+# as upper-case alphanumerics (see _place_key) and these map one spelling onto the other
+STATE_ALIASES = {
+    'ORISSA': 'ODISHA',
+    'HIMACHAL': 'HIMACHALPRADESH',
+    'UTTARANCHAL': 'UTTARAKHAND',
+    'UTTRAKHAND': 'UTTARAKHAND',
+    'CHATISGARH': 'CHHATTISGARH',
+    'PONDICHERRY': 'PUDUCHERRY',
+}
+# the normals predate Telangana and list its districts under Andhra Pradesh
+TELANGANA_DISTRICTS = {'ADILABAD', 'HYDERABAD', 'KARIMNAGAR', 'KHAMMAM', 'MAHABUBNAGAR',
+                       'MEDAK', 'NALGONDA', 'NIZAMABAD', 'RANGAREDDY', 'WARANGAL'}
+# per state: mandi spelling -> normals spelling; districts created after the normals
+# were published map to the district they were carved out of
+DISTRICT_ALIASES = {
+    'ANDHRAPRADESH': {'CHITTOR': 'CHITTOOR'},
+    'GUJARAT': {'BANASKANTH': 'BANASKANTHA', 'JUNAGARH': 'JUNAGADH', 'VADODARA': 'BARODA'},
+    'HARYANA': {'HISSAR': 'HISAR', 'MAHENDRAGARHNARNAUL': 'MAHENDRAGARH', 'SONIPAT': 'SONEPAT'},
+    'KERALA': {'KANNUR': 'CANNUR', 'PALAKAD': 'PALAKKAD', 'THIRSSUR': 'THRISSUR',
+               'THIRUVANANTHAPURAM': 'THIRUVANANTHA'},
+    'ODISHA': {'BOUDH': 'BOUDHGARH', 'SUNDERGARH': 'SUNDARGARH',
+               'JAGATSINGHPUR': 'JAGATSINGHAPU', 'MAYURBHANJA': 'MAYURBHANJ'},
+    'PUNJAB': {'ROPAR': 'RUPNAGAR', 'FAZILKA': 'FEROZEPUR', 'PATHANKOT': 'GURDASPUR'},
+    'RAJASTHAN': {'GANGANAGAR': 'SRIGANGANAGA', 'JAIPURRURAL': 'JAIPUR', 'JODHPURRURAL': 'JODHPUR',
+                  'BEAWAR': 'AJMER', 'SANCHORE': 'JALORE', 'DEEG': 'BHARATPUR'},
+    'TELANGANA': {'MAHBUBNAGAR': 'MAHABUBNAGAR'},
+    'TRIPURA': {'GOMATI': 'SOUTHTRIPURA', 'SOUTHDISTRICT': 'SOUTHTRIPURA', 'KHOWAI': 'WESTTRIPURA'},
+    'UTTARPRADESH': {'AMETHI': 'SULTANPUR', 'AMROHA': 'JYOTIBAPHULE', 'HATHRAS': 'MAHAMAYANAGA',
+                     'KHIRILAKHIMPUR': 'KHERILAKHIMP', 'PILLIBHIT': 'PILIBHIT',
+                     'PRAYAGRAJ': 'ALLAHABAD', 'SANTKABIRNAGAR': 'SANTKABIRNGR',
+                     'SHAMLI': 'MUZAFFARNAGAR', 'SAMBHAL': 'MORADABAD'},
+    'UTTARAKHAND': {'DEHRADOON': 'DEHRADUN', 'NANITAL': 'NAINITAL',
+                    'UDHAMSINGHNAGAR': 'UDHAMSINGHN'},
+    'WESTBENGAL': {'MEDINIPURW': 'WESTMIDNAPOR', 'JHARGRAM': 'WESTMIDNAPOR', 'PURULIYA': 'PURULIA',
+                   'SOUNTH24PARGANAS': 'SOUTH24PARG', 'UTTARDINAJPUR': 'NORTHDINAJPUR'},
+}
+
+
+def _place_key(name: str, aliases: dict) -> str:
+    """Join key for a place name: 'Kozhikode(Calicut)' -> 'KOZHIKODE', aliases applied.
+
+    The full name is looked up first so qualifiers that matter ('Medinipur(W)') can be
+    aliased; otherwise any parenthesised qualifier is dropped.
+    """
+    name = str(name).upper()
+    full = re.sub(r'[^A-Z0-9]', '', name)
+    if full in aliases:
+        return aliases[full]
+    base = re.sub(r'[^A-Z0-9]', '', re.sub(r'\(.*$', '', name))
+    return aliases.get(base, base)
+
+
+def add_place_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """Add state_key/district_key, computed once per distinct (state, district)."""
+    pairs = df[['state', 'district']].drop_duplicates()
+    pairs['state_key'] = pairs['state'].map(lambda s: _place_key(s, STATE_ALIASES))
+    moved = (pairs['state_key'] == 'ANDHRAPRADESH') & pairs['district'].map(
+        lambda d: _place_key(d, {}) in TELANGANA_DISTRICTS)
+    pairs.loc[moved, 'state_key'] = 'TELANGANA'
+    pairs['district_key'] = [_place_key(d, DISTRICT_ALIASES.get(k, {}))
+                             for k, d in zip(pairs['state_key'], pairs['district'])]
+    return df.merge(pairs, on=['state', 'district'], how='left')
+
+
+def _base_name(name: str) -> str:
+    """Lower-cased name without qualifiers ('Rice (Kharif)' -> 'rice')."""
+    return ' '.join(str(name).lower().split('(')[0].split())
+
+
+def _crop_key(name: str, crops: set):
+    """Calendar crop for a mandi commodity name, or None if it is not a calendar crop."""
+    base = _base_name(name)
+    key = CROP_SYNONYMS.get(base, base)
+    return key if key in crops else None
+
+
+def _expand_months(span: str) -> list:
+    """Expand a calendar span such as 'Nov-Jan' into month numbers [11, 12, 1]."""
+    names = [m.strip()[:3].upper() for m in str(span).split('-') if m.strip()]
+    names = [m for m in names if m in MONTHS]
+    if not names:
+        return []
+    start, end = MONTHS.index(names[0]), MONTHS.index(names[-1])
+    length = (end - start) % 12 + 1
+    return [(start + i) % 12 + 1 for i in range(length)]
+
+
+def load_prices(path=RAW/"commodity_price.csv") -> pd.DataFrame:
+    """Load mandi prices and collapse varieties/grades to one row per (commodity, market, day)."""
+    prices = pd.read_csv(path)
+    prices = prices.rename(columns={
+        'State': 'state', 'District': 'district', 'Market': 'market',
+        'Commodity': 'commodity', 'Arrival_Date': 'date',
+        'Min_x0020_Price': 'min_price', 'Max_x0020_Price': 'max_price',
+        'Modal_x0020_Price': 'modal_price',
+    })
+    prices['date'] = pd.to_datetime(prices['date'], format='%d/%m/%Y', errors='coerce')
+    for col in ['state', 'district']:
+        prices[col] = prices[col].str.strip().str.upper()
+    prices = prices.dropna(subset=SERIES_KEYS + ['date', 'modal_price'])
+
+    return (prices.groupby(SERIES_KEYS + ['date'], sort=False, observed=True)
+                  .agg(min_price=('min_price', 'min'),
+                       max_price=('max_price', 'max'),
+                       modal_price=('modal_price', 'median'))
+                  .reset_index())
+
+
+def load_harvest_calendar(path=RAW/"india_crop_calendar.csv") -> pd.DataFrame:
+    """One row per (crop_key, month) in which the crop is harvested."""
+    calendar = pd.read_csv(path)
+    calendar['crop_key'] = calendar['Crop'].map(_base_name)
+    calendar['month'] = calendar['Harvest Months'].map(_expand_months)
+    return (calendar[['crop_key', 'month']].explode('month').dropna()
+                    .astype({'month': 'int64'}).drop_duplicates())
+
+
+def load_rainfall_normals(path=RAW/"district_wise_rainfall_normal.csv") -> pd.DataFrame:
+    """Monthly rainfall normal (mm) in long form keyed on (state_key, district_key, month)."""
+    rain = pd.read_csv(path)
+    rain = rain.rename(columns={'STATE_UT_NAME': 'state', 'DISTRICT': 'district'})
+    rain = add_place_keys(rain)
+    normals = rain.melt(id_vars=['state_key', 'district_key'], value_vars=MONTHS,
+                        var_name='month', value_name='rain_normal_mm')
+    normals['month'] = normals['month'].map(MONTHS.index) + 1
+    return (normals.groupby(['state_key', 'district_key', 'month'], as_index=False)
+                   ['rain_normal_mm'].mean())
+
+
+def load_observed_rainfall(path=RAW/"district_rainfall_daily.csv") -> pd.DataFrame:
+    """Trailing RAIN_WINDOW rainfall per (state_key, district_key, day), if daily observations exist.
+
+    Expects columns State, District, date, rainfall_mm.
+    """
+    obs = pd.read_csv(path, parse_dates=['date'])
+    obs = add_place_keys(obs.rename(columns={'State': 'state', 'District': 'district'}))
+    keys = ['state_key', 'district_key']
+    obs = (obs.groupby(keys + ['date'], as_index=False)['rainfall_mm'].sum()
+              .sort_values(keys + ['date'], ignore_index=True))
+    obs['rain_30d_mm'] = (obs.set_index('date')
+                             .groupby(keys, sort=True)['rainfall_mm']
+                             .rolling(RAIN_WINDOW).sum()
+                             .to_numpy())
+    return obs[keys + ['date', 'rain_30d_mm']]
+
+
+def add_price_features(df: pd.DataFrame) -> pd.DataFrame:
+    """Price spread and grouped rolling volatility per series."""
+    df = df.sort_values(SERIES_KEYS + ['date'], ignore_index=True)
+    df['price_spread'] = df['max_price'] - df['min_price']
+    df['price_spread_pct'] = df['price_spread'] / df['modal_price'].replace(0, np.nan)
+
+    # rows are sorted by the group keys, so the grouped result lines up positionally
+    rolling = (df.set_index('date')
+                 .groupby(SERIES_KEYS, sort=True)['modal_price']
+                 .rolling(VOL_WINDOW, min_periods=2))
+    mean = rolling.mean().to_numpy()
+    std = rolling.std().to_numpy()
+    df['price_volatility_30d'] = std
+    df['price_cv_30d'] = std / np.where(mean == 0, np.nan, mean)
+    return df
+
+
+def add_harvest_pressure(df: pd.DataFrame, calendar: pd.DataFrame) -> pd.DataFrame:
+    """Flag in-harvest commodities and count the state's markets reporting their arrivals.
+
+    `in_harvest` uses the national crop calendar, so `state_harvest_arrival_markets`
+    is the number of markets in the same state that reported arrivals of the
+    commodity that day while it is in its harvest months (0 outside them). It is
+    the same for every market in the state and does not look at local harvests.
+    """
+    # map each distinct commodity once instead of per row
+    crops = set(calendar['crop_key'])
+    keys = pd.Series(df['commodity'].unique())
+    df['crop_key'] = df['commodity'].map(dict(zip(keys, keys.map(lambda k: _crop_key(k, crops)))))
+    df['month'] = df['date'].dt.month
+
+    calendar = calendar.assign(in_harvest=1)
+    df = df.merge(calendar, on=['crop_key', 'month'], how='left')
+    df['in_harvest'] = df['in_harvest'].fillna(0).astype('int8')
+
+    markets = (df.groupby(['commodity', 'state', 'date'], sort=False)['market']
+                 .transform('nunique'))
+    df['state_harvest_arrival_markets'] = (markets * df['in_harvest']).astype('int64')
+    return df
+
+
+def add_rainfall_anomaly(df: pd.DataFrame, normals: pd.DataFrame,
+                         observed: pd.DataFrame = None) -> pd.DataFrame:
+    """Relative departure of trailing rainfall from the district's monthly normal.
+
+    Without observations only the normal is added; the anomaly columns are left out.
+    """
+    df = add_place_keys(df)
+    df = df.merge(normals, on=['state_key', 'district_key', 'month'], how='left')
+    if observed is not None:
+        df = df.merge(observed, on=['state_key', 'district_key', 'date'], how='left')
+        df['rain_anomaly'] = ((df['rain_30d_mm'] - df['rain_normal_mm'])
+                              / df['rain_normal_mm'].replace(0, np.nan))
+    return df.drop(columns=['state_key', 'district_key'])
+
+
+def build_features(prices: pd.DataFrame, calendar: pd.DataFrame,
+                   normals: pd.DataFrame, observed: pd.DataFrame = None) -> pd.DataFrame:
+    df = add_price_features(prices)
+    df = add_harvest_pressure(df, calendar)
+    df = add_rainfall_anomaly(df, normals, observed)
+    return (df.drop(columns=['crop_key', 'month'])
+              .sort_values(SERIES_KEYS + ['date'], ignore_index=True))
+
+
+def main():
+    PROC.mkdir(parents=True, exist_ok=True)
+    try:
+        observed = load_observed_rainfall()
+    except FileNotFoundError:
+        observed = None
+        print("No daily rainfall observations (data/raw/district_rainfall_daily.csv); "
+              "writing features without rain_30d_mm/rain_anomaly")
+
+    features = build_features(load_prices(), load_harvest_calendar(),
+                              load_rainfall_normals(), observed)
+    features.to_csv(PROC/'supply_pressure_features.csv', index=False)
+    print("Saved:", PROC/'supply_pressure_features.csv', features.shape)
+
+    # report series whose district never matched a rainfall normal
+    missing = features['rain_normal_mm'].isna().groupby([features[k] for k in SERIES_KEYS]).all()
+    if missing.any():
+        places = sorted({(s, d) for _, s, d, _ in missing[missing].index})
+        print(f"No rainfall normal for {int(missing.sum())} of {len(missing)} series "
+              f"({len(places)} districts):", ', '.join(f"{d} ({s})" for s, d in places))
+
+
+if __name__ == "__main__":
+    main()
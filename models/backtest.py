@@ -0,0 +1,258 @@
+# models/backtest.py
+# Rolling-origin backtests for every forecaster across all price series.
+# Fold results are cached per (model, series, cutoff) so reruns only fit new cutoffs.
+import argparse
+import hashlib
+import importlib
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from glut_signal import glut_signal
+
+PROC = Path("data/processed")
+CACHE = PROC/"backtest_cache"
+horizon = 30
+
+# forecasters are resolved by name inside the workers so only the models in use get imported;
+# bump the version when a forecaster (or how it is timed) changes so cached folds are recomputed
+MODELS = {
+    'naive': ('naive_forecast', 'forecast_naive', 2),
+    'ema': ('naive_forecast', 'forecast_ema', 2),
+    'sarimax': ('train_price', 'forecast_sarimax', 2),
+}
+# libraries a forecaster imports lazily; loaded before timing so fit_seconds is fit time only
+WARM_IMPORTS = {
+    'sarimax': ['statsmodels.tsa.statespace.sarimax'],
+}
+GLUT_SIGNALS = ('HIGH', 'MEDIUM')  # signals counted as a glut warning
+SERIES_KEYS = ['commodity', 'state', 'district', 'market']
+FOLD_COLUMNS = ['cutoff', 'fingerprint', 'mape', 'coverage_80', 'glut_pred', 'glut_actual',
+                'fit_seconds', 'error']
+
+
+def _series_id(*parts) -> str:
+    """Readable id for a series key plus a short hash of the raw key, so ids cannot collide."""
+    readable = re.sub(r'[^A-Za-z0-9]+', '_', '_'.join(map(str, parts))).strip('_')
+    return f"{readable}_{hashlib.sha1(repr(parts).encode()).hexdigest()[:8]}"
+
+
+def _add_series(series: dict, sid: str, y: pd.Series):
+    if sid in series:
+        raise ValueError(f"Duplicate backtest series id {sid!r}")
+    series[sid] = y
+
+
+def load_series(proc=PROC, min_length: int = 120) -> dict:
+    """Daily modal-price series keyed by series id, from every processed feature file."""
+    series = {}
+    supply = proc/'supply_pressure_features.csv'
+    if supply.exists():
+        df = pd.read_csv(supply, parse_dates=['date'])
+        for keys, g in df.groupby(SERIES_KEYS, sort=False):
+            _add_series(series, _series_id(*keys), g.set_index('date')['modal_price'])
+    for path in sorted(proc.glob('*_features.csv')):
+        if path == supply:
+            continue
+        df = pd.read_csv(path, parse_dates=['date'])
+        _add_series(series, _series_id(path.stem[:-len('_features')]), df.set_index('date')['price'])
+
+    out = {}
+    for sid, y in series.items():
+        y = y.groupby(level=0).mean().sort_index().asfreq('D').ffill().dropna()
+        if len(y) >= min_length:
+            out[sid] = y
+    return out
+
+
+def cutoffs_for(y: pd.Series, horizon: int = horizon, min_train: int = 90, step: int = 14) -> list:
+    """Last training day of each rolling-origin fold."""
+    return [y.index[i - 1] for i in range(min_train, len(y) - horizon + 1, step)]
+
+
+def _resolve(model: str):
+    module, func, _ = MODELS[model]
+    return getattr(importlib.import_module(module), func)
+
+
+def _warm_imports(models):
+    """Import the forecasters and their lazy dependencies (used as the pool initializer)."""
+    for model in models:
+        importlib.import_module(MODELS[model][0])
+        for module in WARM_IMPORTS.get(model, []):
+            importlib.import_module(module)
+
+
+def fold_fingerprint(model: str, y: pd.Series, cutoff, horizon: int = horizon) -> str:
+    """Hash of the model version and the data a fold reads (up to cutoff + horizon)."""
+    end = y.index.get_loc(cutoff) + 1 + horizon
+    window = y.iloc[:end]
+    digest = hashlib.sha1(f'{model}:{MODELS[model][2]}'.encode())
+    digest.update(window.index.asi8.tobytes())
+    digest.update(window.to_numpy(dtype='float64').tobytes())
+    return digest.hexdigest()
+
+
+def _run_fold(task) -> dict:
+    model, sid, y, cutoff, horizon, fingerprint = task
+    train = y.loc[:cutoff]
+    actual = y.iloc[len(train):len(train) + horizon].to_numpy()
+    row = {'model': model, 'series': sid, 'cutoff': cutoff, 'fingerprint': fingerprint, 'mape': np.nan,
+           'coverage_80': np.nan, 'glut_pred': None, 'glut_actual': None,
+           'fit_seconds': np.nan, 'error': None}
+    try:
+        forecaster = _resolve(model)
+        start = time.perf_counter()
+        f = forecaster(train, horizon)
+        row['fit_seconds'] = time.perf_counter() - start
+    except Exception as e:
+        row['error'] = str(e)
+        return row
+
+    pred = f['predicted'].to_numpy()
+    nonzero = actual != 0
+    # MAPE is undefined when every actual price in the horizon is zero; summarize skips it
+    if nonzero.any():
+        row['mape'] = float(np.mean(np.abs(actual[nonzero] - pred[nonzero]) / np.abs(actual[nonzero])) * 100)
+    if f['lower'].notna().all():
+        inside = (actual >= f['lower'].to_numpy()) & (actual <= f['upper'].to_numpy())
+        row['coverage_80'] = float(inside.mean())
+    row['glut_pred'] = glut_signal(train, f['predicted'])
+    row['glut_actual'] = glut_signal(train, pd.Series(actual))
+    return row
+
+
+def _cache_path(model: str, sid: str, horizon: int) -> Path:
+    return CACHE/f'h{horizon}'/model/f'{sid}.csv'
+
+
+def _load_cached(model: str, sid: str, horizon: int) -> pd.DataFrame:
+    path = _cache_path(model, sid, horizon)
+    if not path.exists():
+        return pd.DataFrame(columns=FOLD_COLUMNS)
+    df = pd.read_csv(path, parse_dates=['cutoff'])
+    if 'fingerprint' not in df.columns:
+        return pd.DataFrame(columns=FOLD_COLUMNS)
+    return df[df['error'].isna()]
+
+
+def backtest(series: dict, models=tuple(MODELS), horizon: int = horizon,
+             min_train: int = 90, step: int = 14, workers: int = None) -> pd.DataFrame:
+    """Run every missing or stale (model, series, cutoff) fold in parallel and return all folds.
+
+    A cached fold is reused only if it succeeded and its fingerprint still matches the
+    series data and model version; failed folds are never cached, so they are retried.
+    """
+    cached, current, tasks = {}, {}, []
+    for model in models:
+        for sid, y in series.items():
+            done = _load_cached(model, sid, horizon)
+            cached[model, sid] = done
+            seen = dict(zip(done['cutoff'], done['fingerprint']))
+            wanted = {c: fold_fingerprint(model, y, c, horizon)
+                      for c in cutoffs_for(y, horizon, min_train, step)}
+            current[model, sid] = wanted
+            tasks += [(model, sid, y, c, horizon, fp)
+                      for c, fp in wanted.items() if seen.get(c) != fp]
+
+    workers = workers or os.cpu_count()
+    if tasks and workers > 1:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_warm_imports,
+                                 initargs=(tuple(models),)) as pool:
+            rows = list(pool.map(_run_fold, tasks, chunksize=chunksize))
+    else:
+        if tasks:
+            _warm_imports(models)
+        rows = [_run_fold(t) for t in tasks]
+
+    new = pd.DataFrame(rows, columns=['model', 'series'] + FOLD_COLUMNS)
+    fresh_by_key = {key: g[FOLD_COLUMNS] for key, g in new.groupby(['model', 'series'], sort=False)}
+    folds = []
+    for (model, sid), done in cached.items():
+        fresh = fresh_by_key.get((model, sid), new.iloc[:0][FOLD_COLUMNS])
+        ok = fresh[fresh['error'].isna()]
+        if len(ok):
+            keep = done[~done['cutoff'].isin(ok['cutoff'])]
+            parts = [df for df in (keep, ok) if len(df)]
+            path = _cache_path(model, sid, horizon)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            pd.concat(parts, ignore_index=True).sort_values('cutoff').to_csv(path, index=False)
+
+        # report exactly the requested cutoffs: reused cache hits plus this run's folds
+        wanted = current[model, sid]
+        valid = np.array([wanted.get(c) == fp for c, fp in zip(done['cutoff'], done['fingerprint'])],
+                         dtype=bool)
+        for df in (done.loc[valid], fresh):
+            if len(df):
+                folds.append(df.assign(model=model, series=sid))
+    if not folds:
+        return pd.DataFrame(columns=['model', 'series'] + FOLD_COLUMNS)
+    return pd.concat(folds, ignore_index=True)[['model', 'series'] + FOLD_COLUMNS]
+
+
+def summarize(folds: pd.DataFrame, target_mape: float = 15.0) -> pd.DataFrame:
+    """Accuracy and runtime per model, cheapest first.
+
+    Folds without a MAPE (all-zero actuals) are counted in n_skipped and left out of the metrics.
+    """
+    rows = []
+    for model, g in folds.groupby('model'):
+        done = g[g['error'].isna()]
+        ok = done[done['mape'].notna()]
+        pred = ok['glut_pred'].isin(GLUT_SIGNALS)
+        actual = ok['glut_actual'].isin(GLUT_SIGNALS)
+        tp = int((pred & actual).sum())
+        rows.append({
+            'model': model,
+            'n_series': ok['series'].nunique(),
+            'n_folds': len(ok),
+            'n_failed': len(g) - len(done),
+            'n_skipped': len(done) - len(ok),
+            'mape': ok['mape'].mean(),
+            'coverage_80': ok['coverage_80'].mean(),
+            'glut_precision': tp / pred.sum() if pred.sum() else np.nan,
+            'glut_recall': tp / actual.sum() if actual.sum() else np.nan,
+            'fit_seconds_mean': ok['fit_seconds'].mean(),
+            'fit_seconds_total': ok['fit_seconds'].sum(),
+        })
+    summary = pd.DataFrame(rows)
+    if summary.empty:
+        return summary
+    summary['meets_target'] = summary['mape'] <= target_mape
+    return summary.sort_values('fit_seconds_mean', ignore_index=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rolling-origin backtest of the price forecasters")
+    parser.add_argument('--models', nargs='+', choices=list(MODELS), default=list(MODELS))
+    parser.add_argument('--horizon', type=int, default=horizon)
+    parser.add_argument('--min-train', type=int, default=90)
+    parser.add_argument('--step', type=int, default=14, help="days between cutoffs")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--target-mape', type=float, default=15.0)
+    args = parser.parse_args(argv)
+
+    series = load_series(min_length=args.min_train + args.horizon)
+    print(f"Backtesting {len(args.models)} models on {len(series)} series")
+    start = time.perf_counter()
+    folds = backtest(series, args.models, args.horizon, args.min_train, args.step, args.workers)
+    summary = summarize(folds, args.target_mape)
+    print(f"Done in {time.perf_counter() - start:.1f}s")
+
+    summary.to_csv(PROC/'backtest_summary.csv', index=False)
+    print(summary.to_string(index=False))
+    passing = summary[summary['meets_target']] if len(summary) else summary
+    if len(passing):
+        print(f"Cheapest model meeting MAPE <= {args.target_mape}: {passing.iloc[0]['model']}")
+    else:
+        print(f"No model meets MAPE <= {args.target_mape}")
+
+
+if __name__ == "__main__":
+    main()
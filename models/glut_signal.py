@@ -6,29 +6,78 @@ PROC = Path("data/processed")
 CROP = "tomato"
 MARKET_ID = "MAH_Pune"
 horizon = 30
+HARVEST_MARKETS = 3  # in-harvest arrivals at this many markets in the state raise the risk level
+LEVELS = ['LOW', 'MEDIUM', 'HIGH']
 
-hist = pd.read_csv(PROC/f'{CROP}_{MARKET_ID}_features.csv', parse_dates=['date'])
-f = pd.read_csv(PROC/f'forecast_{CROP}_{MARKET_ID}_{horizon}d.csv', parse_dates=['date'])
-
-hist_mean_30 = hist['price'].tail(30).mean()
-pred_mean_14 = f['predicted'].head(14).mean()
-
-signal = 'LOW'
-if pred_mean_14 < 0.8 * hist_mean_30:
-    signal = 'HIGH'
-elif pred_mean_14 < 0.95 * hist_mean_30:
-    signal = 'MEDIUM'
-
-out = {
-    'market': MARKET_ID, 
-    'crop': CROP, 
-    'hist_mean_30': hist_mean_30, 
-    'pred_mean_14': pred_mean_14, 
-    'signal': signal,
-    'advisory': f"Risk Level: {signal}. " + (
-        "High risk of glut. Consider selling in alternative markets or using cold storage." if signal == 'HIGH'
-        else "Moderate risk. Monitor prices closely." if signal == 'MEDIUM'
-        else "Low risk. Normal market conditions expected."
-    )
-}
-print(out)
\ No newline at end of file
+
+def glut_means(hist_prices: pd.Series, predicted: pd.Series) -> tuple:
+    """Mean of the last 30 days of prices and of the next 14 predicted days."""
+    return hist_prices.tail(30).mean(), predicted.head(14).mean()
+
+
+def signal_from_means(hist_mean_30: float, pred_mean_14: float) -> str:
+    signal = 'LOW'
+    if pred_mean_14 < 0.8 * hist_mean_30:
+        signal = 'HIGH'
+    elif pred_mean_14 < 0.95 * hist_mean_30:
+        signal = 'MEDIUM'
+    return signal
+
+
+def glut_signal(hist_prices: pd.Series, predicted: pd.Series) -> str:
+    """Compare the next 14 days against the last 30 days of prices."""
+    return signal_from_means(*glut_means(hist_prices, predicted))
+
+
+def supply_pressure_adjust(signal: str, in_harvest: int, harvest_markets: int) -> str:
+    """Raise the risk one level when the crop is in harvest across many markets in the state."""
+    if in_harvest and harvest_markets >= HARVEST_MARKETS:
+        return LEVELS[min(LEVELS.index(signal) + 1, len(LEVELS) - 1)]
+    return signal
+
+
+def latest_supply_pressure(crop: str, market_name: str, proc=PROC):
+    """Most recent supply-pressure features (etl/build_features.py) for a crop and market, if any."""
+    path = proc/'supply_pressure_features.csv'
+    if not path.exists():
+        return None
+    cols = ['commodity', 'market', 'date', 'in_harvest', 'state_harvest_arrival_markets',
+            'price_spread_pct', 'price_volatility_30d']
+    df = pd.read_csv(path, usecols=cols, parse_dates=['date'])
+    df = df[(df['commodity'].str.lower() == crop.lower()) & (df['market'].str.lower() == market_name.lower())]
+    if df.empty:
+        return None
+    return df.sort_values('date').iloc[-1].drop(['commodity', 'market']).to_dict()
+
+
+def main(crop: str = CROP, market_id: str = MARKET_ID, horizon: int = horizon):
+    hist = pd.read_csv(PROC/f'{crop}_{market_id}_features.csv', parse_dates=['date'])
+    f = pd.read_csv(PROC/f'forecast_{crop}_{market_id}_{horizon}d.csv', parse_dates=['date'])
+
+    hist_mean_30, pred_mean_14 = glut_means(hist['price'], f['predicted'])
+    signal = signal_from_means(hist_mean_30, pred_mean_14)
+
+    supply = None
+    if 'market_name' in hist.columns:
+        supply = latest_supply_pressure(crop, str(hist['market_name'].iloc[-1]))
+    if supply is not None:
+        signal = supply_pressure_adjust(signal, supply['in_harvest'], supply['state_harvest_arrival_markets'])
+
+    out = {
+        'market': market_id, 
+        'crop': crop, 
+        'hist_mean_30': hist_mean_30, 
+        'pred_mean_14': pred_mean_14, 
+        'signal': signal,
+        'supply_pressure': supply,
+        'advisory': f"Risk Level: {signal}. " + (
+            "High risk of glut. Consider selling in alternative markets or using cold storage." if signal == 'HIGH'
+            else "Moderate risk. Monitor prices closely." if signal == 'MEDIUM'
+            else "Low risk. Normal market conditions expected."
+        )
+    }
+    print(out)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,11 +7,33 @@ CROP = "tomato"
 MARKET_ID = "MAH_Pune"
 horizon = 30
 
-df = pd.read_csv(PROC/f'{CROP}_{MARKET_ID}_features.csv', parse_dates=['date']).set_index('date')
-last_ma = df['price'].rolling(7).mean().iloc[-1]
-dates = pd.date_range(df.index.max()+pd.Timedelta(days=1), periods=horizon)
-out = pd.DataFrame({'date': dates, 'predicted': [last_ma]*horizon})
-out['lower'] = out['predicted']*0.9
-out['upper'] = out['predicted']*1.1
-out.to_csv(PROC/f'forecast_{CROP}_{MARKET_ID}_{horizon}d.csv', index=False)
-print("Naive forecast saved:", out.shape)
\ No newline at end of file
+
+def forecast_naive(y: pd.Series, horizon: int = horizon) -> pd.DataFrame:
+    """Flat forecast at the last 7-day moving average with a +/-10% band."""
+    last_ma = y.rolling(7).mean().iloc[-1]
+    dates = pd.date_range(y.index.max()+pd.Timedelta(days=1), periods=horizon)
+    out = pd.DataFrame({'date': dates, 'predicted': [last_ma]*horizon})
+    out['lower'] = out['predicted']*0.9
+    out['upper'] = out['predicted']*1.1
+    return out
+
+
+def forecast_ema(y: pd.Series, horizon: int = horizon, span: int = 5) -> pd.DataFrame:
+    """Flat forecast at the last EMA value, as used by the API's `_forecast_prices`. No interval."""
+    last_ema = y.ewm(span=span).mean().iloc[-1]
+    dates = pd.date_range(y.index.max()+pd.Timedelta(days=1), periods=horizon)
+    out = pd.DataFrame({'date': dates, 'predicted': [last_ema]*horizon})
+    out['lower'] = float('nan')
+    out['upper'] = float('nan')
+    return out
+
+
+def main(crop: str = CROP, market_id: str = MARKET_ID, horizon: int = horizon):
+    df = pd.read_csv(PROC/f'{crop}_{market_id}_features.csv', parse_dates=['date']).set_index('date')
+    out = forecast_naive(df['price'], horizon)
+    out.to_csv(PROC/f'forecast_{crop}_{market_id}_{horizon}d.csv', index=False)
+    print("Naive forecast saved:", out.shape)
+
+
+if __name__ == "__main__":
+    main()
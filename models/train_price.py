@@ -1,6 +1,5 @@
 # models/train_price.py
 import pandas as pd
-from statsmodels.tsa.statespace.sarimax import SARIMAX
 from pathlib import Path
 
 PROC = Path("data/processed")
@@ -8,22 +7,36 @@ CROP = "tomato"
 MARKET_ID = "MAH_Pune"
 horizon = 30
 
-df = pd.read_csv(PROC/f'{CROP}_{MARKET_ID}_features.csv', parse_dates=['date'])
-df = df.set_index('date').sort_index()
-y = df['price'].asfreq('D').fillna(method='ffill')
-
-# quick SARIMAX (very small orders to be fast)
-model = SARIMAX(y, order=(1,1,1), seasonal_order=(1,1,1,7), enforce_stationarity=False, enforce_invertibility=False)
-res = model.fit(disp=False)
-pred = res.get_forecast(steps=horizon)
-pred_mean = pred.predicted_mean
-ci = pred.conf_int(alpha=0.2)  # 80% PI
-
-out = pd.DataFrame({
-    'date': pred_mean.index,
-    'predicted': pred_mean.values,
-    'lower': ci.iloc[:,0].values,
-    'upper': ci.iloc[:,1].values
-})
-out.to_csv(PROC/f'forecast_{CROP}_{MARKET_ID}_{horizon}d.csv', index=False)
-print("Forecast saved:", out.shape)
\ No newline at end of file
+
+def forecast_sarimax(y: pd.Series, horizon: int = horizon) -> pd.DataFrame:
+    """SARIMAX forecast with an 80% prediction interval."""
+    # statsmodels is slow to import; only pay for it when actually fitting
+    from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+    y = y.asfreq('D').ffill()
+
+    # quick SARIMAX (very small orders to be fast)
+    model = SARIMAX(y, order=(1,1,1), seasonal_order=(1,1,1,7), enforce_stationarity=False, enforce_invertibility=False)
+    res = model.fit(disp=False)
+    pred = res.get_forecast(steps=horizon)
+    pred_mean = pred.predicted_mean
+    ci = pred.conf_int(alpha=0.2)  # 80% PI
+
+    return pd.DataFrame({
+        'date': pred_mean.index,
+        'predicted': pred_mean.values,
+        'lower': ci.iloc[:,0].values,
+        'upper': ci.iloc[:,1].values
+    })
+
+
+def main(crop: str = CROP, market_id: str = MARKET_ID, horizon: int = horizon):
+    df = pd.read_csv(PROC/f'{crop}_{market_id}_features.csv', parse_dates=['date'])
+    df = df.set_index('date').sort_index()
+    out = forecast_sarimax(df['price'], horizon)
+    out.to_csv(PROC/f'forecast_{crop}_{market_id}_{horizon}d.csv', index=False)
+    print("Forecast saved:", out.shape)
+
+
+if __name__ == "__main__":
+    main()